@@ -0,0 +1,78 @@
+# ops/_bench.py
+"""Gemeinsame Helfer für die Benchmarks in ops/ (Timing, Metadaten, JSON-Ausgabe)."""
+from __future__ import annotations
+import json, platform, statistics, subprocess, sys, time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional
+
+def git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5, check=True,
+        )
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+def meta(benchmark: str) -> Dict[str, Any]:
+    return {
+        "benchmark": benchmark,
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+    }
+
+def calibrate(fn: Callable[[], Any], min_time: float = 0.1) -> int:
+    """Loop-Anzahl, mit der eine Runde ~min_time s dauert."""
+    fn()  # warmup (Regex-/Template-Caches)
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time / 10 or loops >= 1 << 24:
+            break
+        loops *= 2
+    return max(1, int(loops * min_time / max(elapsed, 1e-9)))
+
+def run_round(fn: Callable[[], Any], loops: int) -> float:
+    """Eine Runde, Ergebnis in ns/op."""
+    t0 = time.perf_counter()
+    for _ in range(loops):
+        fn()
+    return (time.perf_counter() - t0) / loops * 1e9
+
+def summarize(runs: List[float], loops: int) -> Dict[str, Any]:
+    return {
+        "loops": loops,
+        "repeat": len(runs),
+        "ns_min": round(min(runs), 1),
+        "ns_median": round(statistics.median(runs), 1),
+        "ns_mean": round(statistics.fmean(runs), 1),
+    }
+
+def timeit(fn: Callable[[], Any], repeat: int = 5, min_time: float = 0.1) -> Dict[str, Any]:
+    """Kalibriert die Loop-Anzahl auf ~min_time s pro Runde und misst `repeat` Runden (ns/op)."""
+    loops = calibrate(fn, min_time)
+    return summarize([run_round(fn, loops) for _ in range(repeat)], loops)
+
+def percentiles(samples_ns: List[float]) -> Dict[str, float]:
+    s = sorted(samples_ns)
+    def pct(p: float) -> float:
+        return round(s[min(len(s) - 1, int(p / 100 * len(s)))] / 1e3, 1)
+    return {
+        "samples": len(s),
+        "us_p50": pct(50), "us_p90": pct(90), "us_p99": pct(99), "us_max": round(s[-1] / 1e3, 1),
+    }
+
+def emit(result: Dict[str, Any], out: Optional[str] = None) -> None:
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if out:
+        p = Path(out)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text(text + "\n", encoding="utf-8")
+    print(text)
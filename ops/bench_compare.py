@@ -0,0 +1,147 @@
+# ops/bench_compare.py
+"""
+Vergleicht Benchmark-JSONs zweier Stände (z.B. zwei Commits) Metrik für Metrik.
+
+    python3 -m ops.bench_compare --base old-{1,2,3}.json --head new-{1,2,3}.json [--threshold 15]
+
+Mehrere Dateien pro Seite = wiederholte Läufe (empfohlen: 3 je Seite); je Metrik
+zählt der Median über die Läufe, das dämpft Ausreißer-Läufe in beide Richtungen.
+Einzelne Läufe streuen auf geteilten Maschinen um ~15 %.
+
+Nur stabile Metriken entscheiden über den Exit-Code (ns_median, us_p50,
+req_per_s, us_per_req). ns_min, Tail-Latenzen (p90/p99/max) und Speicher-
+kennzahlen werden nur berichtet: ns_min kippt auf VMs durch einzelne zu
+schnelle Runden (Clock-/Steal-Artefakte) um 30-50 %. Gruppen mit weniger
+als --min-samples Samples (z.B. einzelne Macro-Cases) werden ebenfalls nur
+berichtet.
+Exit-Code 1, wenn eine gegatete Metrik um mehr als --threshold Prozent schlechter wird
+(bei Basiswert 0: wenn sie überhaupt schlechter wird).
+
+Alle Läufe müssen gleich konfiguriert sein (benchmark, config, encoder, sizes),
+sonst Abbruch mit Exit-Code 2; --allow-config-mismatch macht daraus eine Warnung.
+"""
+from __future__ import annotations
+import argparse, json, statistics, sys
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+# höher = schlechter (Zeiten, Speicher); req_per_s ist die Ausnahme
+_HIGHER_IS_BETTER = ("req_per_s",)
+_GATED = ("ns_median", "us_p50", "req_per_s", "us_per_req")
+_IGNORED = ("loops", "repeat", "n", "policies")
+# beschreiben, *wie* gemessen wurde -> müssen auf beiden Seiten identisch sein
+_SETUP_KEYS = ("benchmark", "config", "encoder", "sizes")
+
+class ConfigMismatch(ValueError):
+    pass
+
+def _flatten(d: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    out: Dict[str, float] = {}
+    for k, v in d.items():
+        key = f"{prefix}.{k}" if prefix else k
+        if k in _IGNORED:
+            continue
+        if isinstance(v, dict):
+            out.update(_flatten(v, key))
+        elif isinstance(v, (int, float)) and not isinstance(v, bool):
+            out[key] = float(v)
+    return out
+
+def _aggregate(runs: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Median je Metrik über wiederholte Läufe; Samples = kleinster Lauf (Basis jeder Einzel-Perzentile)."""
+    flat = [_flatten(r.get("results", {})) for r in runs]
+    out: Dict[str, float] = {}
+    for key in set.intersection(*(set(f) for f in flat)):
+        vals = [f[key] for f in flat]
+        out[key] = min(vals) if key.rsplit(".", 1)[-1] == "samples" else statistics.median(vals)
+    return out
+
+def _samples(flat: Dict[str, float], key: str) -> float:
+    prefix = key.rsplit(".", 1)[0] if "." in key else ""
+    return flat.get(f"{prefix}.samples" if prefix else "samples", float("inf"))
+
+def _setup(run: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: run[k] for k in _SETUP_KEYS if k in run}
+
+def _check_setup(base: List[Dict[str, Any]], head: List[Dict[str, Any]]) -> List[str]:
+    """Unterschiede im Mess-Setup gegenüber dem ersten Base-Lauf."""
+    ref = _setup(base[0])
+    problems = []
+    for side, runs in (("base", base), ("head", head)):
+        for i, run in enumerate(runs):
+            setup = _setup(run)
+            for k in sorted(ref.keys() | setup.keys()):
+                if ref.get(k) != setup.get(k):
+                    problems.append(f"{side}[{i}].{k}: {setup.get(k)!r} != {ref.get(k)!r}")
+    return problems
+
+def compare(
+    base: List[Dict[str, Any]],
+    head: List[Dict[str, Any]],
+    threshold: float,
+    min_samples: int = 200,
+    allow_config_mismatch: bool = False,
+) -> Dict[str, Any]:
+    mismatches = _check_setup(base, head)
+    if mismatches and not allow_config_mismatch:
+        raise ConfigMismatch("; ".join(mismatches))
+
+    b = _aggregate(base)
+    h = _aggregate(head)
+    metrics: Dict[str, Any] = {}
+    regressions = []
+    for key in sorted(b.keys() & h.keys()):
+        if key.split(".")[-1] == "samples":
+            continue
+        higher_is_better = key.endswith(_HIGHER_IS_BETTER)
+        gated = key.endswith(_GATED) and min(_samples(b, key), _samples(h, key)) >= min_samples
+        if b[key]:
+            delta: Optional[float] = round((h[key] - b[key]) / b[key] * 100, 1)
+            worse = -delta if higher_is_better else delta
+            regressed = worse > threshold
+        else:
+            # Basis 0: keine Prozentangabe möglich, jede Verschlechterung zählt
+            delta = None
+            regressed = (h[key] < 0) if higher_is_better else (h[key] > 0)
+        metrics[key] = {"base": b[key], "head": h[key], "delta_pct": delta, "gated": gated}
+        if gated and regressed:
+            regressions.append(key)
+    return {
+        "benchmark": head[-1].get("benchmark"),
+        "base_commit": base[-1].get("commit"),
+        "head_commit": head[-1].get("commit"),
+        "runs": {"base": len(base), "head": len(head)},
+        "threshold_pct": threshold,
+        "min_samples": min_samples,
+        "config_mismatches": mismatches,
+        "regressions": regressions,
+        "metrics": metrics,
+    }
+
+def _load(paths: List[str]) -> List[Dict[str, Any]]:
+    return [json.loads(Path(p).read_text(encoding="utf-8")) for p in paths]
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--base", nargs="+", required=True, help="Ergebnis-JSON(s) des Vergleichsstands")
+    ap.add_argument("--head", nargs="+", required=True, help="Ergebnis-JSON(s) des neuen Stands")
+    ap.add_argument("--threshold", type=float, default=15.0, help="Regression ab x Prozent (Rauschmarge)")
+    ap.add_argument("--min-samples", type=int, default=200, help="Mindest-Samples für Gating von Latenz-Gruppen")
+    ap.add_argument("--allow-config-mismatch", action="store_true", help="unterschiedliches Setup nur warnen")
+    args = ap.parse_args()
+
+    try:
+        res = compare(
+            _load(args.base), _load(args.head), args.threshold, args.min_samples,
+            allow_config_mismatch=args.allow_config_mismatch,
+        )
+    except ConfigMismatch as e:
+        print(f"config mismatch, refusing to compare: {e}", file=sys.stderr)
+        sys.exit(2)
+    for m in res["config_mismatches"]:
+        print(f"warning: config mismatch: {m}", file=sys.stderr)
+    print(json.dumps(res, indent=2))
+    sys.exit(1 if res["regressions"] else 0)
+
+if __name__ == "__main__":
+    main()
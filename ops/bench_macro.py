@@ -0,0 +1,149 @@
+# ops/bench_macro.py
+"""
+Macrobenchmark: /suggest in-process gegen den Mock-Core, LLM gestubbt.
+
+Orchestrator (src/app.py) und Mock-Core (tools/mock_core.py) laufen beide
+in-process über Starlette's TestClient; kein Netzwerk, kein Ollama. Mit
+--llm-stub wird der Polish-Pfad aktiviert, polish_reply gibt aber nur den
+Entwurf zurück (misst den Overhead ohne Modelllatenz).
+
+    python3 -m ops.bench_macro [--requests 2000] [--rounds 5] [--llm-stub] [--out ops/results/macro.json] [--profile ops/profiles]
+
+Per-Request Profile: PROFILE_REQUESTS=1 setzen (siehe src/core/profiling.py).
+--profile sampelt stattdessen den gesamten Lauf (alle Threads) in eine Datei.
+Ausgabe: JSON (stdout und optional --out).
+"""
+from __future__ import annotations
+import argparse, json, os, time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# vor dem Import von src.app: kein echter Ollama-Client
+os.environ.setdefault("USE_OLLAMA_POLISH", "0")
+
+from fastapi.testclient import TestClient
+
+import src.app as orchestrator
+from ops._bench import meta, percentiles, emit
+from src.adapters.yovite_core import YoviteCoreAdapter
+from src.core.profiling import StackSampler
+from tools.mock_core import app as core_app
+
+TESTS_PATH = Path("clients/yovite/eval/test_tickets.jsonl")
+
+# Cases mit Enrichment über den Mock-Core (Order/Voucher Lookups)
+CORE_CASES: List[Tuple[str, Dict]] = [
+    ("core-cancel-order-4711", {
+        "ticket": {"subject": "Storno", "body": "Bitte stornieren Sie meine Bestellung.", "anrede": "Guten Tag"},
+        "context": {"order_id": "4711"},
+    }),
+    ("core-cancel-by-email", {
+        "ticket": {"subject": "Widerruf", "body": "Ich möchte widerrufen."},
+        "context": {"email_from": "x@ex.de"},
+    }),
+    ("core-cancel-redeemed", {
+        "ticket": {"subject": "Storno", "body": "Bitte stornieren."},
+        "context": {"order_id": "9001", "voucher_code": "XYZ789", "pin": "1111"},
+    }),
+    ("core-redeem-online", {
+        "ticket": {"subject": "Einlösen", "body": "Wie kann ich den Gutschein einlösen?"},
+        "context": {"voucher_code": "ABC123", "pin": "9999"},
+    }),
+    ("core-expired", {
+        "ticket": {"subject": "Frage", "body": "Ist mein Gutschein noch gültig?"},
+        "context": {"voucher_code": "OLD000", "pin": "0000"},
+    }),
+    ("core-voucher-404", {
+        "ticket": {"subject": "Frage", "body": "Gutschein unbekannt?"},
+        "context": {"voucher_code": "NOPE"},
+    }),
+]
+
+def _stub_polish(decision_text: str, draft: str, user_message: str) -> str:
+    return draft
+
+def _load_cases() -> List[Tuple[str, Dict]]:
+    cases: List[Tuple[str, Dict]] = []
+    if TESTS_PATH.exists():
+        with TESTS_PATH.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                case = json.loads(line)
+                cases.append((case.get("name", f"id-{case.get('id')}"), case["input"]))
+    return cases + CORE_CASES
+
+def _setup(llm_stub: bool) -> TestClient:
+    orchestrator.core = YoviteCoreAdapter(client=TestClient(core_app, base_url="http://core"))
+    if llm_stub:
+        orchestrator.USE_OLLAMA = True
+        orchestrator.polish_reply = _stub_polish
+    else:
+        orchestrator.USE_OLLAMA = False
+    return TestClient(orchestrator.app)
+
+def _run(client: TestClient, cases: List[Tuple[str, Dict]], n: int) -> Tuple[List[float], Dict[str, List[float]], Counter]:
+    total: List[float] = []
+    per_case: Dict[str, List[float]] = defaultdict(list)
+    policies: Counter = Counter()
+    for i in range(n):
+        name, payload = cases[i % len(cases)]
+        t0 = time.perf_counter_ns()
+        r = client.post("/suggest", json=payload)
+        dt = time.perf_counter_ns() - t0
+        r.raise_for_status()
+        total.append(dt)
+        per_case[name].append(dt)
+        policies[r.json().get("policy")] += 1
+    return total, per_case, policies
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--warmup", type=int, default=100)
+    ap.add_argument("--rounds", type=int, default=5, help="req_per_s = beste Runde (robuster gegen Ausreißer)")
+    ap.add_argument("--llm-stub", action="store_true", help="Polish-Pfad aktivieren (gestubbt)")
+    ap.add_argument("--out", help="JSON zusätzlich in Datei schreiben")
+    ap.add_argument("--profile", help="Verzeichnis für collapsed stacks des gesamten Laufs")
+    args = ap.parse_args()
+
+    cases = _load_cases()
+    client = _setup(args.llm_stub)
+    _run(client, cases, args.warmup)
+
+    sampler = StackSampler(all_threads=True).start() if args.profile else None
+    total: List[float] = []
+    per_case: Dict[str, List[float]] = defaultdict(list)
+    policies: Counter = Counter()
+    per_round = max(1, args.requests // args.rounds)
+    best_rps = 0.0
+    for _ in range(args.rounds):
+        t0 = time.perf_counter()
+        r_total, r_cases, r_policies = _run(client, cases, per_round)
+        best_rps = max(best_rps, per_round / (time.perf_counter() - t0))
+        total += r_total
+        for name, v in r_cases.items():
+            per_case[name] += v
+        policies.update(r_policies)
+    if sampler is not None:
+        sampler.stop()
+
+    out = meta("macro")
+    out["config"] = {
+        "requests": per_round * args.rounds, "rounds": args.rounds, "warmup": args.warmup,
+        "llm_stub": args.llm_stub, "cases": len(cases),
+    }
+    if sampler is not None:
+        out["profile"] = str(sampler.write(Path(args.profile) / "macro-suggest.folded"))
+    out["results"] = {
+        "req_per_s": round(best_rps, 1),
+        **percentiles(total),
+        "per_case": {name: percentiles(v) for name, v in sorted(per_case.items())},
+        "policies": dict(policies),
+    }
+    emit(out, args.out)
+
+if __name__ == "__main__":
+    main()
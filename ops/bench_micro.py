@@ -0,0 +1,133 @@
+# ops/bench_micro.py
+"""
+Microbenchmarks für die Policy-Engine und Guardrails.
+
+Deckt infer_intent, decide_policy, generate_reply und die Guardrail-Checks
+über drei Ticketgrößen ab (small / typical / pathological).
+
+    python3 -m ops.bench_micro [--out ops/results/micro.json] [--filter decide] [--profile ops/profiles]
+
+--profile schreibt pro Benchmark eine collapsed-stack Datei (flamegraph-ready).
+Ausgabe: JSON (stdout und optional --out).
+"""
+from __future__ import annotations
+import argparse, time
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Tuple
+
+from ops._bench import meta, calibrate, run_round, summarize, emit
+from src.core.agent import infer_intent, decide_policy, generate_reply
+from src.core.guardrails import forbidden, too_long, contains_sie, check_reply
+from src.core.profiling import StackSampler
+from src.core.records import OrderRecord, VoucherRecord
+
+MAX_WORDS = 180
+
+# =========================
+# Fixtures
+# =========================
+_TYPICAL_BODY = (
+    "Sehr geehrte Damen und Herren,\n\n"
+    "ich habe am 20.08. über Ihre Seite einen Restaurantgutschein als Geschenk gekauft. "
+    "Leider hat sich die Situation geändert und die beschenkte Person zieht in eine andere Stadt. "
+    "Ich möchte die Bestellung daher gerne stornieren. Die Bestellnummer lautet 4711, "
+    "bezahlt habe ich per PayPal. Der Gutschein wurde noch nicht verwendet. "
+    "Können Sie mir bitte sagen, wie es jetzt weitergeht?\n\n"
+    "Vielen Dank und freundliche Grüße\nAnna Müller"
+)
+
+# pathologisch: sehr lang, viele Whitespace-Runs, Beinahe-Treffer ohne echten Match
+# -> jede Regex muss den kompletten Text scannen, bevor GENERAL zurückkommt
+_PATHO_CHUNK = "stornos   widerrufsrecht\t\trücktrittsrecht  gutscheine   einlass codes pins \n\n "
+_PATHO_BODY = _PATHO_CHUNK * 2500
+
+TICKETS: Dict[str, Tuple[str, str]] = {
+    "small": ("Storno", "Bitte stornieren."),
+    "typical": ("Stornierung Bestellung 4711", _TYPICAL_BODY),
+    "pathological": ("Frage " * 200, _PATHO_BODY),
+}
+
+ANREDE: Dict[str, str] = {
+    "small": "Guten Tag",
+    "typical": "Sehr geehrte Frau Müller",
+    "pathological": "Sehr geehrte " + "Frau Dr. Müller-" * 200,
+}
+
+_TYPICAL_REPLY = generate_reply(
+    decide_policy(None, None, "storno", OrderRecord(payment_status="PAID", created_at=time.strftime("%Y-%m-%d"))),
+    "Sehr geehrte Frau Müller",
+) + " Sie erhalten eine Bestätigung per E-Mail, sobald der Vorgang abgeschlossen ist." * 6
+
+REPLIES: Dict[str, str] = {
+    "small": "Guten Tag,\n\nvielen Dank.\n\nFreundliche Grüße",
+    "typical": _TYPICAL_REPLY,
+    "pathological": ("Wir prüfen Ihre Anfrage sorgfältig und melden uns. " * 4000) + " erstattung",
+}
+
+ORDER = OrderRecord(order_id="4711", created_at="2025-08-20", payment_status="PAID", refund_status="NONE")
+VOUCHER = VoucherRecord(voucher_code="XYZ789", status="NOT_REDEEMED", type="restaurant", issue_date="2023-09-01")
+
+# =========================
+# Benchmarks
+# =========================
+def _cases() -> List[Tuple[str, Callable[[], Any]]]:
+    cases: List[Tuple[str, Callable[[], Any]]] = []
+    for size, (subject, body) in TICKETS.items():
+        text = f"{subject} {body}".strip()
+        anrede = ANREDE[size]
+        reply = REPLIES[size]
+        policy = decide_policy(None, None, text, ORDER, VOUCHER)
+
+        cases += [
+            (f"infer_intent[{size}]", lambda s=subject, b=body: infer_intent(s, b, {})),
+            (f"decide_policy[{size}]", lambda t=text: decide_policy(None, None, t, ORDER, VOUCHER)),
+            (f"generate_reply[{size}]", lambda p=policy, a=anrede: generate_reply(p, a)),
+            # REFUND_ALLOWED_14D -> forbidden() scannt tatsächlich
+            (f"guard.forbidden[{size}]", lambda r=reply: forbidden(r, "REFUND_ALLOWED_14D")),
+            (f"guard.too_long[{size}]", lambda r=reply: too_long(r, MAX_WORDS)),
+            (f"guard.contains_sie[{size}]", lambda r=reply: contains_sie(r)),
+            (f"guard.check_reply[{size}]", lambda r=reply: check_reply(r, "REFUND_ALLOWED_14D", MAX_WORDS)),
+        ]
+    return cases
+
+def _profile(name: str, fn: Callable[[], Any], out_dir: Path, seconds: float) -> str:
+    with StackSampler() as sampler:
+        t_end = time.perf_counter() + seconds
+        while time.perf_counter() < t_end:
+            fn()
+    return str(sampler.write(out_dir / f"micro-{name.replace('[', '-').replace(']', '')}.folded"))
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--out", help="JSON zusätzlich in Datei schreiben")
+    ap.add_argument("--filter", default="", help="nur Benchmarks, deren Name den Teilstring enthält")
+    ap.add_argument("--repeat", type=int, default=7)
+    ap.add_argument("--min-time", type=float, default=0.1, help="Sekunden pro Runde")
+    ap.add_argument("--profile", help="Verzeichnis für collapsed stacks (eine Datei pro Benchmark)")
+    ap.add_argument("--profile-seconds", type=float, default=1.0)
+    args = ap.parse_args()
+
+    cases = [(name, fn) for name, fn in _cases() if args.filter in name]
+    loops = {name: calibrate(fn, args.min_time) for name, fn in cases}
+
+    # Runden verschränkt über alle Benchmarks: Drift der Maschine (Takt, Nachbarn)
+    # trifft alle Cases gleich statt nur die, die gerade laufen
+    runs: Dict[str, List[float]] = {name: [] for name, _ in cases}
+    for _ in range(args.repeat):
+        for name, fn in cases:
+            runs[name].append(run_round(fn, loops[name]))
+
+    results: Dict[str, Any] = {}
+    for name, fn in cases:
+        res = summarize(runs[name], loops[name])
+        if args.profile:
+            res["profile"] = _profile(name, fn, Path(args.profile), args.profile_seconds)
+        results[name] = res
+
+    out = meta("micro")
+    out["sizes"] = {k: {"ticket_chars": len(s) + len(b), "reply_chars": len(REPLIES[k])} for k, (s, b) in TICKETS.items()}
+    out["results"] = results
+    emit(out, args.out)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+# ops/bench_models.py
+"""
+Speicher-/Allokations-Benchmark: Dict-Pfad (bis 0.2.1) vs. slotted Records.
+
+Simuliert den /suggest Hot Path ohne HTTP:
+Core-Payload -> Enrichment -> Policy-Ergebnis -> Flags -> Insights -> JSON.
+Die Policy-Engine selbst ist in beiden Pfaden identisch und wird ausgeklammert;
+verglichen wird nur das Datenmodell inkl. Serialisierung. Der Legacy-Pfad
+serialisiert wie FastAPI bei einem zurückgegebenen Dict (jsonable_encoder +
+JSONResponse.render), der neue Pfad wie FastJSONResponse.render.
+
+    python3 -m ops.bench_models [--n 5000] [--out ops/results/models.json]
+
+Ausgabe: JSON auf stdout (vergleichbar über Commits).
+"""
+from __future__ import annotations
+import argparse, gc, json, sys, time, tracemalloc
+from typing import Dict, Callable, Any, Tuple
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+from fastapi.encoders import jsonable_encoder
+
+from ops._bench import meta, emit
+from src.core.records import OrderRecord, VoucherRecord, PolicyResult, Flags
+
+# Payloads wie von tools/mock_core.py geliefert
+ORDER = {
+    "order_id": "4711",
+    "buyer_email": "kunde@example.com",
+    "created_at": "2025-08-20",
+    "total_amount": 50.0,
+    "currency": "EUR",
+    "payment_status": "PAID",
+    "paid_at": "2025-08-20",
+    "refund_status": "NONE",
+}
+VOUCHER = {
+    "voucher_code": "XYZ789",
+    "pin": "1111",
+    "type": "restaurant",
+    "issue_date": "2023-09-01",
+    "valid_until": "2026-12-31",
+    "status": "REDEEMED",
+    "remaining_value": 0.0,
+    "bound_restaurant_id": "R1",
+    "redeemed_at": "2025-08-15",
+}
+# Core liefert null bzw. lässt Keys weg -> Insights müssen Key-genau gleich bleiben
+ORDER_NULLS = {
+    "order_id": None,
+    "created_at": None,
+    "payment_status": None,
+}
+VOUCHER_NULLS = {
+    "voucher_code": "XYZ789",
+    "status": None,
+    "valid_until": None,
+}
+FIXTURES: Dict[str, Tuple[Dict, Dict]] = {
+    "mock": (ORDER, VOUCHER),
+    "nulls": (ORDER_NULLS, VOUCHER_NULLS),
+}
+REPLY = "Guten Tag,\n\nder Gutschein wurde bereits genutzt.\n\nFreundliche Grüße\nYovite Support"
+
+# Beide Pfade geben alle Zwischenobjekte des Requests zurück (Response-Bytes zuletzt),
+# damit _measure die Allokationen eines Requests vollständig sieht.
+
+# =========================
+# Legacy: alles als Dict
+# =========================
+def legacy_path(order_in: Dict, voucher_in: Dict) -> Tuple[Any, ...]:
+    # wie bis 0.2.1: Adapter-Dicts direkt weiterverwenden (keine Kopie)
+    order: Dict = order_in
+    voucher_core: Dict = voucher_in
+    status = voucher_core.get("status")
+    issue_date = voucher_core.get("issue_date")
+    # bis 0.2.1 war das Policy-Ergebnis ein Dict
+    policy = {
+        "code": "REFUND_DENIED_REDEEMED",
+        "template_de": "refund_denied_redeemed",
+        "intent": "CANCEL",
+        "meta": {"voucher_status": status},
+    }
+    flags = {
+        "forbidden": False,
+        "too_long": len(REPLY.split()) > 180,
+        "contains_sie": (" sie " in (" " + REPLY.lower() + " ")),
+    }
+    needs_human = flags["forbidden"] or flags["too_long"]
+    insights = {
+        "order": {k: order.get(k) for k in ["order_id", "payment_status", "refund_status"] if k in order},
+        "voucher": {k: voucher_core.get(k) for k in ["voucher_code", "status", "valid_until"] if k in voucher_core},
+        "used_inputs": {"status": status, "issue_date": issue_date},
+    }
+    body = {
+        "intent": policy.get("intent"), "policy": policy["code"], "reply": REPLY,
+        "flags": flags, "needs_human": needs_human, "insights": insights,
+    }
+    # FastAPI serialize_response -> Starlette JSONResponse.render
+    encoded = jsonable_encoder(body)
+    raw = json.dumps(encoded, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+    return order, voucher_core, policy, flags, insights, body, encoded, raw
+
+# =========================
+# Neu: Records + orjson
+# =========================
+def records_path(order_in: Dict, voucher_in: Dict) -> Tuple[Any, ...]:
+    order = OrderRecord.from_core(order_in)
+    voucher_core = VoucherRecord.from_core(voucher_in)
+    status = voucher_core.status
+    issue_date = voucher_core.issue_date
+    policy = PolicyResult(
+        code="REFUND_DENIED_REDEEMED",
+        template_de="refund_denied_redeemed",
+        intent="CANCEL",
+        meta={"voucher_status": status},
+    )
+    flags = Flags(
+        forbidden=False,
+        too_long=len(REPLY.split()) > 180,
+        contains_sie=(" sie " in (" " + REPLY.lower() + " ")),
+    )
+    insights = {
+        "order": order.insights(),
+        "voucher": voucher_core.insights(),
+        "used_inputs": {"status": status, "issue_date": issue_date},
+    }
+    body = {
+        "intent": policy.intent, "policy": policy.code, "reply": REPLY,
+        "flags": flags.as_dict(), "needs_human": flags.needs_human, "insights": insights,
+    }
+    # FastJSONResponse.render
+    if orjson is not None:
+        raw = orjson.dumps(body)
+    else:
+        raw = json.dumps(body, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+    return order, voucher_core, policy, flags, insights, body, raw
+
+# =========================
+# Messung
+# =========================
+_NO_TRACEMALLOC = [tracemalloc.Filter(False, tracemalloc.__file__)]
+
+def _measure(fn: Callable[[], Any], n: int) -> Dict[str, Any]:
+    fn()  # warmup (Caches, interned Strings)
+
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    elapsed = time.perf_counter() - t0
+
+    # Allokationen eines Requests: alle Zwischenobjekte bleiben bis zum zweiten Snapshot
+    # am Leben (Rückgabewert). Nur intern sofort freigegebene Temporaries fehlen; die
+    # stecken in peak_bytes_per_req. gc.collect() leert die Freelists (dict/tuple/...),
+    # sonst kämen wiederverwendete Objekte ohne malloc und damit ohne Trace.
+    # Hinweis: orjson reserviert für die Response einen ~4 KB Puffer, der im
+    # Records-Pfad voll in alloc_bytes_per_req zählt.
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objs = fn()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    # erst nach beiden Snapshots filtern (filter_traces kompiliert selbst fnmatch-Patterns)
+    stats = after.filter_traces(_NO_TRACEMALLOC).compare_to(before.filter_traces(_NO_TRACEMALLOC), "lineno")
+    raw = objs[-1]
+    del objs
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "n": n,
+        "us_per_req": round(elapsed / n * 1e6, 2),
+        "alloc_blocks_per_req": sum(max(st.count_diff, 0) for st in stats),
+        "alloc_bytes_per_req": sum(max(st.size_diff, 0) for st in stats),
+        "peak_bytes_per_req": peak,
+        "response_len": len(raw),
+    }
+
+def _sizes() -> Dict[str, Dict[str, int]]:
+    """Shallow-Größen der Objekte, die der jeweilige Pfad pro Request hält."""
+    order = OrderRecord.from_core(ORDER)
+    voucher = VoucherRecord.from_core(VOUCHER)
+    return {
+        # Legacy hält die vollständigen Core-Payloads (8 bzw. 9 Keys)
+        "dict": {
+            "order": sys.getsizeof(ORDER),
+            "voucher": sys.getsizeof(VOUCHER),
+            "policy": sys.getsizeof({"code": "X", "template_de": "x", "intent": "GENERAL", "meta": {}}),
+        },
+        # Records inkl. present-Tupel
+        "records": {
+            "order": sys.getsizeof(order) + sys.getsizeof(order.present),
+            "voucher": sys.getsizeof(voucher) + sys.getsizeof(voucher.present),
+            "policy": sys.getsizeof(PolicyResult(code="X", template_de="x", intent="GENERAL")),
+        },
+    }
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--n", type=int, default=5000, help="Iterationen pro Variante")
+    ap.add_argument("--out", help="JSON zusätzlich in Datei schreiben")
+    args = ap.parse_args()
+
+    for name, (o, v) in FIXTURES.items():
+        assert json.loads(legacy_path(o, v)[-1]) == json.loads(records_path(o, v)[-1]), \
+            f"Pfade liefern unterschiedliche Antworten ({name})"
+
+    out = meta("models")
+    out["encoder"] = "orjson" if orjson is not None else "json"
+    out["object_bytes"] = _sizes()
+    out["results"] = {
+        "legacy": _measure(lambda: legacy_path(ORDER, VOUCHER), args.n),
+        "records": _measure(lambda: records_path(ORDER, VOUCHER), args.n),
+    }
+    emit(out, args.out)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+# src/adapters/yovite_core.py
+from __future__ import annotations
+from typing import Optional, Dict
+import os, httpx
+
+CORE_URL     = os.getenv("CORE_URL", "http://localhost:8001")
+try:
+    CORE_TIMEOUT = float(os.getenv("CORE_TIMEOUT", "5"))
+except Exception:
+    CORE_TIMEOUT = 5.0
+
+class YoviteCoreAdapter:
+    """Read-only Zugriff auf Yovite-Core (/core/v1/*), siehe tools/mock_core.py."""
+
+    def __init__(self, base_url: Optional[str] = None, client: Optional[httpx.Client] = None):
+        # client injizierbar, z.B. Starlette TestClient gegen den Mock (in-process)
+        self._client = client or httpx.Client(base_url=base_url or CORE_URL, timeout=CORE_TIMEOUT)
+
+    def _get(self, path: str, params: Dict) -> Dict:
+        r = self._client.get(path, params={k: v for k, v in params.items() if v is not None})
+        r.raise_for_status()
+        return r.json() or {}
+
+    def get_order(self, order_id: Optional[str] = None, email: Optional[str] = None) -> Dict:
+        return self._get("/core/v1/order", {"order_id": order_id, "email": email})
+
+    def get_voucher(self, code: str, pin: Optional[str] = None) -> Dict:
+        return self._get("/core/v1/voucher", {"code": code, "pin": pin})
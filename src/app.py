@@ -1,12 +1,22 @@
 # src/app.py
 from __future__ import annotations
 from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from typing import Optional, Dict
+from typing import Optional, Any
 import os, httpx
 
+# orjson ist optional: schneller Encoder für die Response, sonst Stdlib-JSON
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 from src.adapters.yovite_core import YoviteCoreAdapter
 from src.core.agent import decide_policy, generate_reply
+from src.core.guardrails import check_reply
+from src.core.profiling import profile_request
+from src.core.records import OrderRecord, VoucherRecord, PolicyResult, Flags
 
 # ---- Helpers / Config parsing
 def _get_bool(name: str, default: bool) -> bool:
@@ -35,8 +45,20 @@ if USE_OLLAMA:
 # ---- External adapters
 core = YoviteCoreAdapter()
 
+# ---- Fast JSON response
+class FastJSONResponse(JSONResponse):
+    """JSONResponse via orjson (falls installiert). Inhalt muss bereits JSON-nativ sein."""
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content)
+        return super().render(content)
+
 # ---- FastAPI app
-app = FastAPI(title="Yovite AI Orchestrator", version="0.2.1")
+app = FastAPI(
+    title="Yovite AI Orchestrator",
+    version="0.2.1",
+    default_response_class=FastJSONResponse,
+)
 
 # ---- Models
 class Ticket(BaseModel):
@@ -80,17 +102,6 @@ def health_ollama():
     except Exception as e:
         return {"ok": False, "error": str(e), "gen_model": GEN_MODEL}
 
-# ---- Forbidden / Guardrails
-FORBIDDEN_KEYS = ["erstattung", "barauszahlung", "teil-auszahlung", "teilauszahlung"]
-# Nur bei Policies, die echte Rückabwicklungen/Payments anstoßen könnten
-ALLOW_PAYOUT_POLICIES = {"REFUND_ALLOWED_14D"}
-
-def forbidden(text: str, policy_code: str) -> bool:
-    if policy_code not in ALLOW_PAYOUT_POLICIES:
-        return False
-    low = f" {text.lower()} "
-    return any(k in low for k in FORBIDDEN_KEYS)
-
 # ---- Main endpoint
 @app.post("/suggest")
 def suggest(req: SuggestReq, x_api_key: Optional[str] = Header(default=None)):
@@ -98,33 +109,42 @@ def suggest(req: SuggestReq, x_api_key: Optional[str] = Header(default=None)):
     if API_KEY and x_api_key != API_KEY:
         raise HTTPException(status_code=401, detail="Unauthorized")
 
+    # opt-in Sampling-Profiler (PROFILE_REQUESTS=1), sonst No-op
+    with profile_request("suggest"):
+        return _suggest(req)
+
+def _suggest(req: SuggestReq) -> FastJSONResponse:
+    # Validierung endet hier (Pydantic); ab jetzt nur noch schlanke Records
     ticket = req.ticket
-    v_in   = req.voucher or Voucher()
-    ctx    = req.context or Context()
+    v_in   = req.voucher
+    ctx    = req.context
+
+    order_id     = ctx.order_id if ctx else None
+    email_from   = ctx.email_from if ctx else None
+    voucher_code = (ctx.voucher_code if ctx else None) or (v_in.code if v_in else None)
 
     # ----- Enrichment from Yovite-Core (read-only)
-    order: Dict = {}
-    voucher_core: Dict = {}
+    order: Optional[OrderRecord] = None
+    voucher_core: Optional[VoucherRecord] = None
 
-    if ctx.order_id or ctx.email_from:
+    if order_id or email_from:
         try:
-            order = core.get_order(order_id=ctx.order_id, email=ctx.email_from) or {}
+            order = OrderRecord.from_core(core.get_order(order_id=order_id, email=email_from))
         except Exception:
-            order = {}
+            order = None
 
-    voucher_code = ctx.voucher_code or v_in.code
     if voucher_code:
         try:
-            voucher_core = core.get_voucher(code=voucher_code, pin=ctx.pin) or {}
+            voucher_core = VoucherRecord.from_core(core.get_voucher(code=voucher_code, pin=ctx.pin if ctx else None))
         except Exception:
-            voucher_core = {}
+            voucher_core = None
 
     # ----- Inputs für Policy Engine
-    status     = v_in.status or voucher_core.get("status")
-    issue_date = v_in.issue_date or voucher_core.get("issue_date")
+    status     = (v_in.status if v_in else None) or (voucher_core.status if voucher_core else None)
+    issue_date = (v_in.issue_date if v_in else None) or (voucher_core.issue_date if voucher_core else None)
     text       = f"{ticket.subject or ''} {ticket.body}".strip()
 
-    policy = decide_policy(
+    policy: PolicyResult = decide_policy(
         status=status,
         issue_date=issue_date,
         text=text,
@@ -137,30 +157,26 @@ def suggest(req: SuggestReq, x_api_key: Optional[str] = Header(default=None)):
 
     # LLM style polish (nie Policy überschreiben)
     if USE_OLLAMA:
-        decision_text = f"{policy['code']}: {policy['template_de']}"
+        decision_text = f"{policy.code}: {policy.template_de}"
         reply = polish_reply(decision_text, draft, text).strip()
     else:
         reply = draft
 
-    flags = {
-        "forbidden": forbidden(reply, policy["code"]),
-        "too_long": len(reply.split()) > MAX_WORDS,
-        "contains_sie": (" sie " in (" " + reply.lower() + " ")),
-    }
-    needs_human = flags["forbidden"] or flags["too_long"]
+    flags: Flags = check_reply(reply, policy.code, MAX_WORDS)
 
     # PII-arme Insights
     insights = {
-        "order": {k: order.get(k) for k in ["order_id", "payment_status", "refund_status"] if k in order},
-        "voucher": {k: voucher_core.get(k) for k in ["voucher_code", "status", "valid_until"] if k in voucher_core},
+        "order": order.insights() if order else {},
+        "voucher": voucher_core.insights() if voucher_core else {},
         "used_inputs": {"status": status, "issue_date": issue_date}
     }
 
-    return {
-        "intent": policy.get("intent"),
-        "policy": policy["code"],
+    # direkt als Response zurückgeben -> kein jsonable_encoder-Durchlauf
+    return FastJSONResponse({
+        "intent": policy.intent,
+        "policy": policy.code,
         "reply": reply,
-        "flags": flags,
-        "needs_human": needs_human,
+        "flags": flags.as_dict(),
+        "needs_human": flags.needs_human,
         "insights": insights
-    }
\ No newline at end of file
+    })
@@ -5,6 +5,8 @@ from datetime import datetime, date
 from typing import Optional, Dict
 from pathlib import Path
 
+from src.core.records import OrderRecord, VoucherRecord, PolicyResult
+
 # Python 3.11+: tomllib ist in der Stdlib; bei 3.10 -> tomli installieren und import anpassen
 try:
     import tomllib as tomli  # type: ignore
@@ -67,18 +69,18 @@ def decide_policy(
     status: Optional[str],
     issue_date: Optional[str],
     text: str,
-    order: Optional[Dict] = None,
-    voucher: Optional[Dict] = None,
+    order: Optional[OrderRecord] = None,
+    voucher: Optional[VoucherRecord] = None,
     cfg: Optional[Dict] = None,
-) -> Dict:
+) -> PolicyResult:
     """
     Returns:
-      {
-        "code": "...",
-        "template_de": "...",
-        "intent": "CANCEL|REDEEM_HELP|GENERAL",
-        "meta": {...}
-      }
+      PolicyResult(
+        code="...",
+        template_de="...",
+        intent="CANCEL|REDEEM_HELP|GENERAL",
+        meta={...},
+      )
     """
     cfg = cfg or {}
     refund_days = int(cfg.get("refund_days", REFUND_DAYS_DEFAULT))
@@ -87,80 +89,80 @@ def decide_policy(
     subject = ""
     body = text
     ctx = {
-        "order_id": (order or {}).get("order_id"),
-        "voucher_code": (voucher or {}).get("voucher_code"),
+        "order_id": order.order_id if order else None,
+        "voucher_code": voucher.voucher_code if voucher else None,
     }
     intent = infer_intent(subject, body, ctx)
 
     # Normalize core data
-    order_created = _parse_date((order or {}).get("created_at"))
+    order_created = _parse_date(order.created_at if order else None)
     days = _days_since(order_created) if order_created else None
-    payment_status = (order or {}).get("payment_status", "").upper()  # PAID/...
-    v_status = ((voucher or {}).get("status") or (status or "")).upper() or None
-    v_type = (voucher or {}).get("type", "")
+    payment_status = ((order.payment_status if order else None) or "").upper()  # PAID/...
+    v_status = ((voucher.status if voucher else None) or (status or "")).upper() or None
+    v_type = (voucher.type if voucher else None) or ""
 
     # ---- CANCEL
     if intent == "CANCEL":
         if payment_status == "PAID":
             if v_status in ("REDEEMED", "PARTIALLY_REDEEMED"):
-                return {
-                    "code": "REFUND_DENIED_REDEEMED",
-                    "template_de": "refund_denied_redeemed",
-                    "intent": intent,
-                    "meta": {"voucher_status": v_status},
-                }
+                return PolicyResult(
+                    code="REFUND_DENIED_REDEEMED",
+                    template_de="refund_denied_redeemed",
+                    intent=intent,
+                    meta={"voucher_status": v_status},
+                )
             if days is not None and days <= refund_days:
-                return {
-                    "code": "REFUND_ALLOWED_14D",
-                    "template_de": "refund_allowed",
-                    "intent": intent,
-                    "meta": {"days_since_purchase": days},
-                }
-            return {
-                "code": "REFUND_DENIED_TIMEOUT",
-                "template_de": "refund_timeout",
-                "intent": intent,
-                "meta": {"days_since_purchase": days},
-            }
+                return PolicyResult(
+                    code="REFUND_ALLOWED_14D",
+                    template_de="refund_allowed",
+                    intent=intent,
+                    meta={"days_since_purchase": days},
+                )
+            return PolicyResult(
+                code="REFUND_DENIED_TIMEOUT",
+                template_de="refund_timeout",
+                intent=intent,
+                meta={"days_since_purchase": days},
+            )
         else:
-            return {
-                "code": "CANCEL_NO_PAYMENT",
-                "template_de": "cancel_no_payment",
-                "intent": intent,
-                "meta": {"payment_status": payment_status or "UNKNOWN"},
-            }
+            return PolicyResult(
+                code="CANCEL_NO_PAYMENT",
+                template_de="cancel_no_payment",
+                intent=intent,
+                meta={"payment_status": payment_status or "UNKNOWN"},
+            )
 
     # ---- REDEEM_HELP
     if intent == "REDEEM_HELP":
         if v_type.lower() == "universal" or not v_type:
-            return {
-                "code": "INSTRUCT_REDEEM_ONLINE",
-                "template_de": "redeem_online",
-                "intent": intent,
-                "meta": {"voucher_type": v_type or "universal"},
-            }
-        return {
-            "code": "INSTRUCT_REDEEM_RESTAURANT",
-            "template_de": "redeem_restaurant",
-            "intent": intent,
-            "meta": {"voucher_type": v_type},
-        }
+            return PolicyResult(
+                code="INSTRUCT_REDEEM_ONLINE",
+                template_de="redeem_online",
+                intent=intent,
+                meta={"voucher_type": v_type or "universal"},
+            )
+        return PolicyResult(
+            code="INSTRUCT_REDEEM_RESTAURANT",
+            template_de="redeem_restaurant",
+            intent=intent,
+            meta={"voucher_type": v_type},
+        )
 
     # ---- GENERAL / Fallbacks
     if v_status == "EXPIRED":
-        return {
-            "code": "EXPIRED_NOT_REDEEMABLE",
-            "template_de": "expired",
-            "intent": "GENERAL",
-            "meta": {},
-        }
+        return PolicyResult(
+            code="EXPIRED_NOT_REDEEMABLE",
+            template_de="expired",
+            intent="GENERAL",
+            meta={},
+        )
 
-    return {
-        "code": "INFO_GENERIC",
-        "template_de": "info_generic",
-        "intent": "GENERAL",
-        "meta": {},
-    }
+    return PolicyResult(
+        code="INFO_GENERIC",
+        template_de="info_generic",
+        intent="GENERAL",
+        meta={},
+    )
 
 # =========================
 # Templating
@@ -248,8 +250,8 @@ def _load_templates() -> Dict:
     }
     return _TEMPLATE_CACHE
 
-def generate_reply(policy: Dict, anrede: Optional[str]) -> str:
-    tpl_name = policy.get("template_de") or "info_generic"
+def generate_reply(policy: PolicyResult, anrede: Optional[str]) -> str:
+    tpl_name = policy.template_de or "info_generic"
     T = _load_templates()
     rec = (T.get(tpl_name) or {})
     text = rec.get("text")
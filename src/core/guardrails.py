@@ -0,0 +1,30 @@
+# src/core/guardrails.py
+from __future__ import annotations
+
+from src.core.records import Flags
+
+# =========================
+# Forbidden / Guardrails
+# =========================
+FORBIDDEN_KEYS = ["erstattung", "barauszahlung", "teil-auszahlung", "teilauszahlung"]
+# Nur bei Policies, die echte Rückabwicklungen/Payments anstoßen könnten
+ALLOW_PAYOUT_POLICIES = {"REFUND_ALLOWED_14D"}
+
+def forbidden(text: str, policy_code: str) -> bool:
+    if policy_code not in ALLOW_PAYOUT_POLICIES:
+        return False
+    low = f" {text.lower()} "
+    return any(k in low for k in FORBIDDEN_KEYS)
+
+def too_long(text: str, max_words: int) -> bool:
+    return len(text.split()) > max_words
+
+def contains_sie(text: str) -> bool:
+    return " sie " in (" " + text.lower() + " ")
+
+def check_reply(reply: str, policy_code: str, max_words: int) -> Flags:
+    return Flags(
+        forbidden=forbidden(reply, policy_code),
+        too_long=too_long(reply, max_words),
+        contains_sie=contains_sie(reply),
+    )
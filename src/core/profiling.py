@@ -0,0 +1,145 @@
+# src/core/profiling.py
+"""
+Opt-in Sampling-Profiler für den Orchestrator.
+
+Ein Hintergrund-Thread liest in festem Intervall den Stack des Ziel-Threads
+(sys._current_frames) und zählt identische Stacks. Ausgabe im "collapsed"
+Format (eine Zeile pro Stack: "root;...;leaf <count>"), direkt nutzbar mit
+flamegraph.pl, inferno oder speedscope.
+
+Aktivierung per ENV:
+  PROFILE_REQUESTS=1        -> pro Request eine .folded-Datei
+  PROFILE_DIR=ops/profiles  -> Zielverzeichnis
+  PROFILE_INTERVAL_MS=1     -> Sampling-Intervall
+
+Hinweis: CPU-gebundener Code gibt den GIL nur alle sys.getswitchinterval()
+Sekunden ab (Default 5 ms); effektiv wird also höchstens so oft gesampelt.
+"""
+from __future__ import annotations
+import itertools, logging, os, sys, threading, time
+from collections import Counter
+from contextlib import nullcontext
+from pathlib import Path
+from types import FrameType
+from typing import Optional, ContextManager
+
+# ---- Config
+PROFILE_REQUESTS    = os.getenv("PROFILE_REQUESTS", "").strip() in ("1", "true", "TRUE", "yes", "YES")
+PROFILE_DIR         = Path(os.getenv("PROFILE_DIR", "ops/profiles"))
+try:
+    PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "1"))
+except Exception:
+    PROFILE_INTERVAL_MS = 1.0
+
+log = logging.getLogger(__name__)
+
+_NULL = nullcontext()
+_SEQ = itertools.count()
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+# =========================
+# Sampler
+# =========================
+class StackSampler:
+    """Samples the stack of one thread (default: the calling thread) until stop().
+
+    all_threads=True samples every thread except the sampler itself, e.g. when the
+    work runs in a threadpool worker that is not known up front.
+    """
+
+    def __init__(
+        self,
+        thread_id: Optional[int] = None,
+        interval_ms: float = PROFILE_INTERVAL_MS,
+        all_threads: bool = False,
+    ):
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.all_threads = all_threads
+        self.interval = max(interval_ms, 0.05) / 1000.0
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _record(self, frame: Optional[FrameType]) -> None:
+        labels = []
+        while frame is not None:
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        labels.reverse()
+        self.stacks[";".join(labels)] += 1
+
+    def _sample_once(self) -> None:
+        frames = sys._current_frames()
+        if self.all_threads:
+            me = threading.get_ident()
+            for tid, frame in frames.items():
+                if tid != me:
+                    self._record(frame)
+        else:
+            target: Optional[FrameType] = frames.get(self.thread_id)
+            if target is None:
+                return
+            self._record(target)
+        self.samples += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample_once()
+
+    def start(self) -> "StackSampler":
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.stacks
+
+    def __enter__(self) -> "StackSampler":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {n}\n" for stack, n in self.stacks.most_common())
+
+    def write(self, path: Path) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.collapsed(), encoding="utf-8")
+        return path
+
+# =========================
+# Per-Request Hook
+# =========================
+class _RequestProfile:
+    def __init__(self, name: str):
+        self.name = name
+        self.sampler = StackSampler()
+
+    def __enter__(self) -> StackSampler:
+        return self.sampler.start()
+
+    def __exit__(self, *exc) -> None:
+        self.sampler.stop()
+        if not self.sampler.samples:
+            return  # Request kürzer als ein Intervall
+        ts = time.strftime("%Y%m%dT%H%M%S")
+        path = PROFILE_DIR / f"{self.name}-{ts}-{os.getpid()}-{next(_SEQ)}.folded"
+        # Debug-Hook darf den Request nie brechen (und auf dem Fehlerpfad keine Exception verdecken)
+        try:
+            self.sampler.write(path)
+        except OSError as e:
+            log.warning("profile dropped, cannot write %s: %s", path, e)
+
+def profile_request(name: str, enabled: Optional[bool] = None) -> ContextManager:
+    """Context manager around one request; no-op unless PROFILE_REQUESTS is set."""
+    if not (PROFILE_REQUESTS if enabled is None else enabled):
+        return _NULL
+    return _RequestProfile(name)
@@ -0,0 +1,95 @@
+# src/core/records.py
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, Tuple
+
+# Schlanke interne Datensätze für den Hot Path.
+# Validierung passiert nur an der Grenze (Pydantic in src/app.py bzw. Core-Antwort),
+# intern arbeiten wir mit slotted, frozen Structs statt mit ad-hoc Dicts.
+
+# =========================
+# Enriched Core Records
+# =========================
+# Insights übernehmen genau die Keys, die der Core geliefert hat (auch mit Wert null).
+# `present` merkt sich diese Keys; die Felder selbst bleiben Optional[str] für die Policy.
+ORDER_INSIGHT_KEYS   = ("order_id", "payment_status", "refund_status")
+VOUCHER_INSIGHT_KEYS = ("voucher_code", "status", "valid_until")
+
+@dataclass(frozen=True, slots=True)
+class OrderRecord:
+    order_id: Optional[str] = None
+    created_at: Optional[str] = None
+    payment_status: Optional[str] = None
+    refund_status: Optional[str] = None
+    present: Tuple[str, ...] = field(default=ORDER_INSIGHT_KEYS, repr=False)
+
+    @classmethod
+    def from_core(cls, data: Optional[Dict]) -> Optional["OrderRecord"]:
+        """Build from a Yovite-Core order payload; None/{} -> None."""
+        if not data:
+            return None
+        return cls(
+            order_id=data.get("order_id"),
+            created_at=data.get("created_at"),
+            payment_status=data.get("payment_status"),
+            refund_status=data.get("refund_status"),
+            present=tuple(k for k in ORDER_INSIGHT_KEYS if k in data),
+        )
+
+    def insights(self) -> Dict[str, Any]:
+        """PII-arme Sicht (keine E-Mail, keine Beträge)."""
+        return {k: getattr(self, k) for k in self.present}
+
+@dataclass(frozen=True, slots=True)
+class VoucherRecord:
+    voucher_code: Optional[str] = None
+    status: Optional[str] = None
+    type: Optional[str] = None
+    issue_date: Optional[str] = None
+    valid_until: Optional[str] = None
+    present: Tuple[str, ...] = field(default=VOUCHER_INSIGHT_KEYS, repr=False)
+
+    @classmethod
+    def from_core(cls, data: Optional[Dict]) -> Optional["VoucherRecord"]:
+        """Build from a Yovite-Core voucher payload; PIN wird bewusst nicht übernommen."""
+        if not data:
+            return None
+        return cls(
+            voucher_code=data.get("voucher_code"),
+            status=data.get("status"),
+            type=data.get("type"),
+            issue_date=data.get("issue_date"),
+            valid_until=data.get("valid_until"),
+            present=tuple(k for k in VOUCHER_INSIGHT_KEYS if k in data),
+        )
+
+    def insights(self) -> Dict[str, Any]:
+        """PII-arme Sicht (kein PIN, kein Restwert)."""
+        return {k: getattr(self, k) for k in self.present}
+
+# =========================
+# Policy / Guardrail Results
+# =========================
+@dataclass(frozen=True, slots=True)
+class PolicyResult:
+    code: str
+    template_de: str
+    intent: str
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass(frozen=True, slots=True)
+class Flags:
+    forbidden: bool
+    too_long: bool
+    contains_sie: bool
+
+    @property
+    def needs_human(self) -> bool:
+        return self.forbidden or self.too_long
+
+    def as_dict(self) -> Dict[str, bool]:
+        return {
+            "forbidden": self.forbidden,
+            "too_long": self.too_long,
+            "contains_sie": self.contains_sie,
+        }